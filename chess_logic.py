@@ -102,30 +102,20 @@ class ChessVar:
     def get_board(self, perspective):
         """
         Returns the list of lists representing the game board from the perspective given as a parameter by calling the
+        get_board_from_perspective method of the board perspective object for that perspective.
         """
-        valid_move_set = set()
         # gets the board perspective object for the perspective given as a parameter
         board_perspective_object = self._board_perspective_dict[perspective]
-        if perspective == 'audience':
-            # return the board from the 'audience' perspective (passing an empty set as the arg)
-            return board_perspective_object.get_board_from_perspective(valid_move_set)
-        else:
-            # get the pieces belonging to the player whose perspective the board is from
-            perspective_player_pieces = self._player_pieces_dict[perspective]['player_pieces']
-            for row in range(len(self._game_board)):
-                for col in range(len(self._game_board[row])):
-                    current_piece = self._game_board[row][col]
-                    if current_piece != ' ':
-                        # get the move type object associated with the current_piece type
-                        move_type_object = self._move_type_dict[current_piece.lower()]
-                        if current_piece in perspective_player_pieces:
-                            valid_move_set.update(move_type_object.is_valid_move((row, col), perspective))
-        # get the board from the given perspective, displaying opponent pieces as '*' unless they are at a location
-        # in the valid_move_set
-        board_from_perspective = board_perspective_object.get_board_from_perspective(valid_move_set)
+        # get the board from the given perspective, displaying opponent pieces as '*' unless they can be captured
+        board_from_perspective = board_perspective_object.get_board_from_perspective()
 
         return board_from_perspective
 
+    def capture_targets(self, player):
+        """Returns a set of square index tuples (row, col) of the opponent pieces that can be captured by the player
+        given as a parameter ('white' or 'black')."""
+        return self._board_perspective_dict[player].capture_targets(player)
+
     def make_move(self, start_square, end_square):
         """
         If the game state is 'UNFINISHED', there is piece at the start position (given
@@ -187,10 +177,96 @@ class ChessVar:
 
 
 class GameBoardDisplay:
-    """Represents a game board display format."""
+    """Represents a game board display format. Precomputes the knight, king and pawn attack tables used to find
+    which opponent pieces can be captured by a player."""
     def __init__(self, game_board, player_pieces_dict):
         self._game_board = game_board
         self._player_pieces_dict = player_pieces_dict
+        self._knight_directions = [[-2, -1], [-2, 1], [2, -1], [2, 1], [-1, -2], [-1, 2], [1, -2], [1, 2]]
+        self._king_directions = [[-1, -1], [-1, 0], [-1, 1], [0, -1], [0, 1], [1, -1], [1, 0], [1, 1]]
+        self._orthogonal_directions = [[-1, 0], [1, 0], [0, -1], [0, 1]]
+        self._diagonal_directions = [[-1, -1], [-1, 1], [1, -1], [1, 1]]
+        # squares a pawn attacking a square must stand on, relative to the attacked square
+        self._pawn_attacker_directions = {
+            'white': [[1, -1], [1, 1]],
+            'black': [[-1, -1], [-1, 1]]
+        }
+        # knight and king moves are symmetric, so the squares a leaper attacks from a square are also the squares
+        # a leaper must stand on to attack that square
+        self._knight_attack_table = self.get_leaper_table(self._knight_directions)
+        self._king_attack_table = self.get_leaper_table(self._king_directions)
+        self._pawn_attacker_table = {
+            'white': self.get_leaper_table(self._pawn_attacker_directions['white']),
+            'black': self.get_leaper_table(self._pawn_attacker_directions['black'])
+        }
+
+    def get_leaper_table(self, directions):
+        """Returns a dictionary mapping each square index tuple (row, col) on the game board to a list of the square
+        index tuples reached from it by the directions given as a parameter that are within the board bounds."""
+        leaper_table = {}
+        for row in range(len(self._game_board)):
+            for col in range(len(self._game_board[row])):
+                leaper_table[(row, col)] = []
+                for direction in directions:
+                    pos_row = row + direction[0]
+                    pos_col = col + direction[1]
+                    if 0 <= pos_row < len(self._game_board):  # row within board bounds
+                        if 0 <= pos_col < len(self._game_board[pos_row]):  # col within board bounds
+                            leaper_table[(row, col)].append((pos_row, pos_col))
+        return leaper_table
+
+    def is_attacked_by_slider(self, square, directions, slider_pieces):
+        """Returns True if the first piece found scanning from the square given as a parameter along any of the
+        directions given as a parameter is one of the slider_pieces given as a parameter, otherwise returns False."""
+        for direction in directions:
+            pos_row = square[0] + direction[0]
+            pos_col = square[1] + direction[1]
+            while 0 <= pos_row < len(self._game_board) and 0 <= pos_col < len(self._game_board[pos_row]):
+                piece = self._game_board[pos_row][pos_col]
+                if piece != ' ':
+                    # the first blocker on the ray is the only piece that can attack along it
+                    if piece in slider_pieces:
+                        return True
+                    break
+                pos_row += direction[0]
+                pos_col += direction[1]
+        return False
+
+    def is_attacked(self, square, player):
+        """Returns True if any piece belonging to the player given as a parameter can move to the square given as a
+        parameter, otherwise returns False."""
+        player_pieces = self._player_pieces_dict[player]['player_pieces']
+        # white pieces are uppercase, so get the player's piece letters with the same case as their pieces
+        if 'K' in player_pieces:
+            knight, king, pawn, rook, bishop, queen = 'N', 'K', 'P', 'R', 'B', 'Q'
+        else:
+            knight, king, pawn, rook, bishop, queen = 'n', 'k', 'p', 'r', 'b', 'q'
+
+        for pos_row, pos_col in self._knight_attack_table[square]:
+            if self._game_board[pos_row][pos_col] == knight:
+                return True
+        for pos_row, pos_col in self._king_attack_table[square]:
+            if self._game_board[pos_row][pos_col] == king:
+                return True
+        for pos_row, pos_col in self._pawn_attacker_table[player][square]:
+            if self._game_board[pos_row][pos_col] == pawn:
+                return True
+        if self.is_attacked_by_slider(square, self._orthogonal_directions, (rook, queen)):
+            return True
+        if self.is_attacked_by_slider(square, self._diagonal_directions, (bishop, queen)):
+            return True
+        return False
+
+    def capture_targets(self, player):
+        """Returns a set of square index tuples (row, col) of the opponent pieces that can be captured by the player
+        given as a parameter, checking each opponent piece for an attacking player piece."""
+        capture_targets_set = set()
+        opponent_pieces = self._player_pieces_dict[player]['opponent_pieces']
+        for row in range(len(self._game_board)):
+            for col in range(len(self._game_board[row])):
+                if self._game_board[row][col] in opponent_pieces and self.is_attacked((row, col), player):
+                    capture_targets_set.add((row, col))
+        return capture_targets_set
 
 
 class Audience(GameBoardDisplay):
@@ -199,7 +275,7 @@ class Audience(GameBoardDisplay):
         super().__init__(game_board, player_pieces_dict)
         self._audience_board = None
 
-    def get_board_from_perspective(self, valid_move_set):
+    def get_board_from_perspective(self):
         """Returns a copy of the game board from the audience perspective as a nested list,
         displaying both white and black pieces."""
         self._audience_board = [[self._game_board[row][col] for col in range(len(self._game_board[row]))]
@@ -213,19 +289,20 @@ class White(GameBoardDisplay):
         super().__init__(game_board, player_pieces_dict)
         self._white_board = None
 
-    def get_board_from_perspective(self, valid_move_set):
+    def get_board_from_perspective(self):
         """Returns a copy of the game board from the white player's perspective as a nested list,
         displaying white pieces and only the black pieces that can be captured by white pieces. The remaining
         black pieces are replaced by '*'."""
         self._white_board = [[self._game_board[row][col] for col in range(len(self._game_board[row]))]
                              for row in range(len(self._game_board))]
         opponent_pieces = self._player_pieces_dict['white']['opponent_pieces']
+        capture_targets_set = self.capture_targets('white')
 
         for row in range(len(self._white_board)):
             for col in range(len(self._white_board[row])):
-                # if there is an opponent piece in this position, and this position is not in the valid_move_set,
-                # replace the piece at this position with '*'
-                if self._white_board[row][col] in opponent_pieces and (row, col) not in valid_move_set:
+                # if there is an opponent piece in this position, and this position is not in the
+                # capture_targets_set, replace the piece at this position with '*'
+                if self._white_board[row][col] in opponent_pieces and (row, col) not in capture_targets_set:
                     self._white_board[row][col] = '*'
 
         return self._white_board
@@ -237,19 +314,20 @@ class Black(GameBoardDisplay):
         super().__init__(game_board, player_pieces_dict)
         self._black_board = None
 
-    def get_board_from_perspective(self, valid_move_set):
+    def get_board_from_perspective(self):
         """Returns a copy of the game board from the black player's perspective as a nested list,
         displaying black pieces and only the white pieces that can be captured by black pieces. The remaining
         white pieces are replaced by '*'."""
         self._black_board = [[self._game_board[row][col] for col in range(len(self._game_board[row]))]
                              for row in range(len(self._game_board))]
         opponent_pieces = self._player_pieces_dict['black']['opponent_pieces']
+        capture_targets_set = self.capture_targets('black')
 
         for row in range(len(self._black_board)):
             for col in range(len(self._black_board[row])):
-                # if there is an opponent piece in this position, and this position is not in the valid_move_set,
-                # replace the piece at this position with '*'
-                if self._black_board[row][col] in opponent_pieces and (row, col) not in valid_move_set:
+                # if there is an opponent piece in this position, and this position is not in the
+                # capture_targets_set, replace the piece at this position with '*'
+                if self._black_board[row][col] in opponent_pieces and (row, col) not in capture_targets_set:
                     self._black_board[row][col] = '*'
 
         return self._black_board